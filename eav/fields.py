@@ -21,14 +21,18 @@ class EavDatatypeField(models.CharField):
         if not instance.pk:
             return
 
-        # added
-        if not type(instance).objects.filter(pk=instance.pk).exists():
+        stored_datatype = (
+            type(instance)
+            .objects.filter(pk=instance.pk)
+            .values_list('datatype', flat=True)
+            .first()
+        )
+
+        # added, or unchanged
+        if stored_datatype is None or stored_datatype == instance.datatype:
             return
 
-        if type(instance).objects.get(pk=instance.pk).datatype == instance.datatype:
-            return
-
-        if instance.value_set.count():
+        if instance.value_set.exists():
             raise ValidationError(
                 _(
                     'You cannot change the datatype of an attribute that is already in use.'
@@ -95,7 +95,7 @@ class BaseDynamicEntityForm(ModelForm):
         # Reset form fields.
         self.fields = deepcopy(self.base_fields)
 
-        for attribute in self.entity.get_all_attributes():
+        for attribute in self.entity.get_all_attributes().with_choices():
             value = getattr(self.entity, attribute.slug)
 
             defaults = {
@@ -108,8 +108,9 @@ class BaseDynamicEntityForm(ModelForm):
             datatype = attribute.datatype
 
             if datatype == attribute.TYPE_ENUM:
-                values = attribute.get_choices().values_list('id', 'value')
-                choices = [('', '-----')] + list(values)
+                choices = [('', '-----')] + [
+                    (choice.pk, choice.value) for choice in attribute.get_choices()
+                ]
                 defaults.update({'choices': choices})
 
                 if value:
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.db.models.fields import UUIDField
 
 
@@ -6,7 +8,17 @@ def get_entity_pk_type(entity_cls) -> str:
 
     These values map to `models.Value` as potential fields to use to relate
     to the proper entity via the correct PK type.
+
+    ``entity_cls`` may also be a model instance; the result is cached per
+    model class.
     """
-    if isinstance(entity_cls._meta.pk, UUIDField):
+    if not isinstance(entity_cls, type):
+        entity_cls = type(entity_cls)
+    return _get_model_pk_type(entity_cls)
+
+
+@lru_cache(maxsize=None)
+def _get_model_pk_type(model_cls) -> str:
+    if isinstance(model_cls._meta.pk, UUIDField):
         return 'entity_uuid'
     return 'entity_id'
@@ -41,7 +41,31 @@ class EnumGroupManager(models.Manager):
         return self.get(name=name)
 
 
-class AttributeManager(models.Manager):
+class AttributeQuerySet(models.QuerySet):
+    """
+    Custom queryset for `Attribute` model.
+
+    This queryset adds utility methods specific to the `Attribute` model.
+    """
+
+    def with_choices(self):
+        """
+        Load the enum group and its values along with the attributes, so
+        enum choices and validation don't need a query per attribute.
+        """
+        return self.select_related('enum_group').prefetch_related(
+            'enum_group__values',
+        )
+
+    def lean(self):
+        """
+        Load only the fields needed to validate and store EAV values,
+        leaving out names, descriptions and timestamps.
+        """
+        return self.only('id', 'datatype', 'slug', 'required', 'enum_group')
+
+
+class AttributeManager(models.Manager.from_queryset(AttributeQuerySet)):
     """
     Custom manager for `Attribute` model.
 
@@ -1,3 +1,4 @@
+import re
 import secrets
 import string
 
@@ -10,10 +11,25 @@ except ImportError:
 
 SLUGFIELD_MAX_LENGTH: Final = 50
 
+_NON_SLUG_CHARS_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATORS_RE = re.compile(r'[-\s]+')
+
+
+def _slugify_ascii(name: str) -> str:
+    """
+    Same as ``slugify(name)`` for ASCII-only ``name``, without the unicode
+    normalization step it doesn't need.
+    """
+    slug = _NON_SLUG_CHARS_RE.sub('', name.lower())
+    return _SLUG_SEPARATORS_RE.sub('-', slug).strip('-_')
+
 
 def generate_slug(name: str) -> str:
     """Generates a valid slug based on ``name``."""
-    slug = slugify(name, allow_unicode=False)
+    if name.isascii():
+        slug = _slugify_ascii(name)
+    else:
+        slug = slugify(name, allow_unicode=False)
 
     if not slug:
         # Fallback to ensure a slug is always generated by using a random one
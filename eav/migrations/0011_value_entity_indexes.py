@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Index Value on the entity and attribute columns used for lookups."""
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('eav', '0010_dynamic_pk_type_for_models'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='value',
+            index=models.Index(
+                fields=['entity_ct', 'entity_id', 'attribute'],
+                name='eav_value_ct_id_attr_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='value',
+            index=models.Index(
+                fields=['entity_ct', 'entity_uuid', 'attribute'],
+                name='eav_value_ct_uuid_attr_idx',
+            ),
+        ),
+    ]
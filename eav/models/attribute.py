@@ -1,10 +1,12 @@
 # ruff: noqa: UP007
 
+import sys
+from operator import attrgetter
 from typing import TYPE_CHECKING, Optional, Tuple  # noqa: UP035
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.db.models import ForeignKey
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -33,6 +35,36 @@ from .value import Value
 if TYPE_CHECKING:
     from .enum_group import EnumGroup
 
+_NOT_LOADED = object()
+
+#: The :class:`Value` field holding the value of each datatype.
+_VALUE_FIELD_BY_DATATYPE = {
+    'text': 'value_text',
+    'float': 'value_float',
+    'int': 'value_int',
+    'date': 'value_date',
+    'bool': 'value_bool',
+    'object': 'value_object',
+    'enum': 'value_enum',
+    'json': 'value_json',
+    'csv': 'value_csv',
+}
+
+#: The columns behind the ``value_object`` generic foreign key.
+_GENERIC_VALUE_COLUMNS = ('generic_value_ct', 'generic_value_id')
+
+_DATATYPE_VALIDATORS = {
+    'text': validate_text,
+    'float': validate_float,
+    'int': validate_int,
+    'date': validate_date,
+    'bool': validate_bool,
+    'object': validate_object,
+    'enum': validate_enum,
+    'json': validate_json,
+    'csv': validate_csv,
+}
+
 
 class Attribute(models.Model):
     """
@@ -84,6 +116,11 @@ class Attribute(models.Model):
 
     .. warning:: Once an Attribute has been used by an entity, you can not
                  change it's datatype.
+
+    .. note::
+       ``lean()`` can be chained onto any attribute queryset to skip loading
+       the descriptive fields of each attribute; :class:`Entity` uses it when
+       validating and saving values.
     """
 
     objects = AttributeManager()
@@ -115,6 +152,9 @@ class Attribute(models.Model):
         (TYPE_CSV, _('Comma-Separated-Value')),
     )
 
+    # Lazy labels, so they are still translated when displayed.
+    _DATATYPE_LABELS = dict(DATATYPE_CHOICES)
+
     # Core attributes
     id = get_pk_format()
 
@@ -201,7 +241,8 @@ class Attribute(models.Model):
     )
 
     def __str__(self) -> str:
-        return f'{self.name} ({self.get_datatype_display()})'
+        label = self._DATATYPE_LABELS.get(self.datatype, self.datatype)
+        return f'{self.name} ({label})'
 
     def natural_key(self) -> Tuple[str, str]:  # noqa: UP006
         """
@@ -219,9 +260,11 @@ class Attribute(models.Model):
             self.slug,
         )
 
-    @property
-    def help_text(self):
-        return self.description
+    # The getter is a C-level attrgetter, so no Python frame per access.
+    help_text = property(
+        attrgetter('description'),
+        doc='Alias of ``description``, used as form field help text.',
+    )
 
     def get_validators(self):
         """
@@ -233,19 +276,32 @@ class Attribute(models.Model):
            method to look elsewhere for additional attribute specific
            validators to return as well as the default, built-in one.
         """
-        DATATYPE_VALIDATORS = {
-            'text': validate_text,
-            'float': validate_float,
-            'int': validate_int,
-            'date': validate_date,
-            'bool': validate_bool,
-            'object': validate_object,
-            'enum': validate_enum,
-            'json': validate_json,
-            'csv': validate_csv,
-        }
+        return [_DATATYPE_VALIDATORS[self.datatype]]
 
-        return [DATATYPE_VALIDATORS[self.datatype]]
+    @property
+    def _enum_values_set(self):
+        """
+        The allowed choices of this attribute's enum group, loaded once so
+        :meth:`validate_value` doesn't query the database for every value.
+
+        The choices are kept for as long as this instance lives, and only
+        reloaded after :meth:`save`, :meth:`refresh_from_db` or when another
+        enum group is assigned. Choices added to the enum group in the
+        meantime are rejected until then.
+        """
+        cached = self.__dict__.get('_enum_values_cache')
+        if cached is None or cached[0] != self.enum_group_id:
+            cached = (self.enum_group_id, self._load_enum_values())
+            self.__dict__['_enum_values_cache'] = cached
+        return cached[1]
+
+    def _load_enum_values(self):
+        """Return the values of this attribute's enum group as a set."""
+        enum_values = self.enum_group.values
+        if 'values' in getattr(self.enum_group, '_prefetched_objects_cache', {}):
+            return frozenset(enum_value.value for enum_value in enum_values.all())
+
+        return frozenset(enum_values.values_list('value', flat=True))
 
     def validate_value(self, value):
         """
@@ -256,12 +312,11 @@ class Attribute(models.Model):
             validator(value)
 
         if self.datatype == self.TYPE_ENUM:
-            if isinstance(value, EnumValue):
-                value = value.value
-            if not self.enum_group.values.filter(value=value).exists():
+            choice = value.value if isinstance(value, EnumValue) else str(value)
+            if choice not in self._enum_values_set:
                 raise ValidationError(
                     _('%(val)s is not a valid choice for %(attr)s')
-                    % {'val': value, 'attr': self},
+                    % {'val': choice, 'attr': self},
                 )
 
     def save(self, *args, **kwargs):
@@ -272,8 +327,71 @@ class Attribute(models.Model):
         if not self.slug:
             self.slug = generate_slug(self.name)
 
-        self.full_clean()
+        self.__dict__.pop('_enum_values_cache', None)
+
+        changed = self._get_changed_fields()
+        if changed is None:
+            self.full_clean()
+        elif changed:
+            self.full_clean(
+                exclude=[
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if field.name not in changed
+                ],
+            )
+
         super().save(*args, **kwargs)
+        self._loaded_values = self._get_field_values()
+
+    def refresh_from_db(self, *args, **kwargs):
+        """Reloads the attribute, dropping its cached enum choices."""
+        self.__dict__.pop('_enum_values_cache', None)
+        super().refresh_from_db(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the values loaded from the database, so :meth:`save` only
+        validates the fields which were changed since.
+
+        The datatype is interned, so comparing it with the ``TYPE_*``
+        constants is settled by an identity check.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'datatype' in instance.__dict__:
+            instance.datatype = sys.intern(instance.datatype)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def _get_field_values(self):
+        """Return the loaded (non-deferred) field values, by attname."""
+        return {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+    def _get_changed_fields(self):
+        """
+        Return the names of the fields changed since this attribute was
+        loaded or last saved, or None if it never was or is about to be
+        inserted as a new row (e.g. copied by setting its pk to None).
+        """
+        loaded_values = getattr(self, '_loaded_values', None)
+        if loaded_values is None or self._state.adding:
+            return None
+
+        if self.pk != loaded_values.get(self._meta.pk.attname, _NOT_LOADED):
+            return None
+
+        return {
+            field.name
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+            and self.__dict__[field.attname]
+            != loaded_values.get(field.attname, _NOT_LOADED)
+        }
 
     def clean(self):
         """
@@ -281,12 +399,16 @@ class Attribute(models.Model):
         attribute's datatype is *TYPE_ENUM* and enum_group is not set, or if
         the attribute is not *TYPE_ENUM* and the enum group is set.
         """
-        if self.datatype == self.TYPE_ENUM and not self.enum_group:
+        is_enum = self.datatype == self.TYPE_ENUM
+        # Check the column rather than the relation, to avoid fetching it.
+        has_enum_group = self.enum_group_id is not None
+
+        if is_enum and not has_enum_group:
             raise ValidationError(
                 _('You must set the choice group for multiple choice attributes'),
             )
 
-        if self.datatype != self.TYPE_ENUM and self.enum_group:
+        if has_enum_group and not is_enum:
             raise ValidationError(
                 _('You can only assign a choice group to multiple choice attributes'),
             )
@@ -302,11 +424,12 @@ class Attribute(models.Model):
             else None
         )
 
-    def save_value(self, entity, value):
+    def save_value(self, entity, value, ct=None):
         """
         Called with *entity*, any Django object registered with eav, and
         *value*, the :class:`Value` this attribute for *entity* should
-        be set to.
+        be set to. *ct* is the ``ContentType`` of *entity*; it is looked up
+        when not given.
 
         If a :class:`Value` object for this *entity* and attribute doesn't
         exist, one will be created.
@@ -315,26 +438,112 @@ class Attribute(models.Model):
            If *value* is None and a :class:`Value` object exists for this
            Attribute and *entity*, it will delete that :class:`Value` object.
         """
-        ct = ContentType.objects.get_for_model(entity)
+        if ct is None:
+            ct = ContentType.objects.get_for_model(entity)
+
+        if value is None or value == '':
+            Value.objects.filter(
+                entity_ct=ct,
+                attribute=self,
+                **{get_entity_pk_type(entity): entity.pk},
+            ).delete()
+            return
+
+        # One SELECT, then a single INSERT or UPDATE (none if unchanged).
+        self.bulk_save_values(entity, [(self, value)], ct=ct)
+
+    @classmethod
+    def bulk_save_values(cls, entity, attr_value_pairs, ct=None):
+        """
+        Like :meth:`save_value`, but for many attributes of *entity* at once.
+        *attr_value_pairs* is an iterable of ``(attribute, value)`` tuples.
+
+        The existing :class:`Value` objects are fetched with a single query
+        and the changes are written in one transaction with at most one
+        insert, one update and one delete query, however many attributes are
+        given.
+
+        .. note::
+           The values are written with bulk queries, so ``Value.save()`` is
+           not called and no ``pre_save``/``post_save`` signals are sent for
+           them.
+        """
+        pairs = list(attr_value_pairs)
+        if not pairs:
+            return
+
+        if ct is None:
+            ct = ContentType.objects.get_for_model(entity)
 
         entity_filter = {
             'entity_ct': ct,
-            'attribute': self,
-            f'{get_entity_pk_type(entity)}': entity.pk,
+            get_entity_pk_type(entity): entity.pk,
+        }
+        existing = {
+            value_obj.attribute_id: value_obj
+            for value_obj in Value.objects.filter(
+                attribute__in=[pair[0] for pair in pairs],
+                **entity_filter,
+            )
         }
 
-        try:
-            value_obj = self.value_set.get(**entity_filter)
-        except Value.DoesNotExist:
-            if value is None or value == '':
-                return
+        to_create, to_update, to_delete = [], [], []
+        update_fields = {'modified'}
+        now = timezone.now()
 
-            value_obj = Value.objects.create(**entity_filter)
+        for attribute, value in pairs:
+            value_obj = existing.get(attribute.pk)
+            field = _VALUE_FIELD_BY_DATATYPE[attribute.datatype]
 
-        if value is None or value == '':
-            value_obj.delete()
+            if value is None or value == '':
+                if value_obj is not None:
+                    to_delete.append(value_obj.pk)
+                continue
+
+            if value_obj is None:
+                value_obj = Value(attribute=attribute, **entity_filter)
+                to_create.append(value_obj)
+            else:
+                value_obj.attribute = attribute
+                if _holds_value(value_obj, field, value):
+                    continue
+                value_obj.modified = now
+                update_fields.update(
+                    _GENERIC_VALUE_COLUMNS if field == 'value_object' else (field,),
+                )
+                to_update.append(value_obj)
+
+            setattr(value_obj, field, value)
+            # Skip the per-row existence queries of the foreign keys: they
+            # point to saved objects and the database enforces them anyway.
+            value_obj.full_clean(
+                exclude=['attribute', 'entity_ct', 'value_enum', 'generic_value_ct'],
+                validate_unique=False,
+            )
+
+        if not (to_delete or to_update or to_create):
             return
 
-        if value != value_obj.value:
-            value_obj.value = value
-            value_obj.save()
+        with transaction.atomic():
+            if to_delete:
+                Value.objects.filter(pk__in=to_delete).delete()
+            if to_update:
+                Value.objects.bulk_update(to_update, sorted(update_fields))
+            if to_create:
+                Value.objects.bulk_create(to_create)
+
+
+def _holds_value(value_obj, field, value):
+    """
+    Return whether *value_obj* already holds *value* in *field*. Foreign keys
+    are compared by id, so the related objects aren't fetched.
+    """
+    if field == 'value_enum':
+        return value_obj.value_enum_id == value.pk
+    if field == 'value_object':
+        value_ct = ContentType.objects.get_for_model(value)
+        return (
+            value_obj.generic_value_ct_id == value_ct.pk
+            and value_obj.generic_value_id == value.pk
+        )
+    return getattr(value_obj, field) == value
@@ -23,7 +23,13 @@ class Entity:
         Pre save handler attached to self.instance.  Called before the
         model instance we are attached to is saved. This allows us to call
         :meth:`validate_attributes` before the entity is saved.
+
+        Skipped when loading fixtures (``raw`` saves), as the EAV values are
+        loaded as separate objects and the database may not be consistent yet.
         """
+        if kwargs.get('raw'):
+            return
+
         instance = kwargs['instance']
         entity = getattr(kwargs['instance'], instance._eav_config_cls.eav_attr)
         entity.validate_attributes()
@@ -32,8 +38,12 @@ class Entity:
     def post_save_handler(sender, *args, **kwargs):
         """
         Post save handler attached to self.instance.  Calls :meth:`save` when
-        the model instance we are attached to is saved.
+        the model instance we are attached to is saved. Skipped when loading
+        fixtures (``raw`` saves).
         """
+        if kwargs.get('raw'):
+            return
+
         instance = kwargs['instance']
         entity = getattr(instance, instance._eav_config_cls.eav_attr)
         entity.save()
@@ -101,7 +111,9 @@ class Entity:
 
     def save(self):
         """Saves all the EAV values that have been set on this entity."""
-        for attribute in self.get_all_attributes():
+        attr_value_pairs = []
+
+        for attribute in self.get_all_attributes().lean():
             if self._hasattr(attribute.slug):
                 attribute_value = self._getattr(attribute.slug)
                 if (
@@ -113,7 +125,9 @@ class Entity:
                     and attribute_value is not None
                 ):
                     attribute_value = EnumValue.objects.get(value=attribute_value)
-                attribute.save_value(self.instance, attribute_value)
+                attr_value_pairs.append((attribute, attribute_value))
+
+        Attribute.bulk_save_values(self.instance, attr_value_pairs, ct=self.ct)
 
     def validate_attributes(self):
         """
@@ -123,7 +137,7 @@ class Entity:
         """
         values_dict = self.get_values_dict()
 
-        for attribute in self.get_all_attributes():
+        for attribute in self.get_all_attributes().lean().with_choices():
             value = None
 
             # Value was assigned to this instance.
@@ -167,7 +181,7 @@ class Entity:
         """Get all set :class:`Value` objects for self.instance."""
         entity_filter = {
             'entity_ct': self.ct,
-            f'{get_entity_pk_type(self.instance)}': self.instance.pk,
+            get_entity_pk_type(self.instance): self.instance.pk,
         }
 
         return Value.objects.filter(**entity_filter).select_related()
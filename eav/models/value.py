@@ -48,6 +48,16 @@ class Value(models.Model):
     class Meta:
         verbose_name = _('Value')
         verbose_name_plural = _('Values')
+        indexes = [
+            models.Index(
+                fields=['entity_ct', 'entity_id', 'attribute'],
+                name='eav_value_ct_id_attr_idx',
+            ),
+            models.Index(
+                fields=['entity_ct', 'entity_uuid', 'attribute'],
+                name='eav_value_ct_uuid_attr_idx',
+            ),
+        ]
 
     id = get_pk_format()
 
@@ -235,7 +235,7 @@ def expand_eav_filter(model_cls, key, value):
     if len(fields) > 1 and config_cls and fields[0] == config_cls.eav_attr:
         slug = fields[1]
         gr_name = config_cls.generic_relation_attr
-        datatype = Attribute.objects.get(slug=slug).datatype
+        datatype = Attribute.objects.lean().get(slug=slug).datatype
 
         value_key = ''
         if datatype == Attribute.TYPE_ENUM and not isinstance(value, EnumValue):
@@ -299,7 +299,7 @@ class EavQuerySet(QuerySet):
             if len(term) == 2 and term[0] == config_cls.eav_attr:
                 # Retrieve Attribute over which the ordering is performed.
                 try:
-                    attr = Attribute.objects.get(slug=term[1])
+                    attr = Attribute.objects.lean().get(slug=term[1])
                 except ObjectDoesNotExist:
                     raise ObjectDoesNotExist(
                         'Cannot find EAV attribute "{}"'.format(term[1])
@@ -1,6 +1,8 @@
 import uuid
 import string
 
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 from hypothesis import given, settings
@@ -11,7 +13,7 @@ from hypothesis.strategies import just
 
 import eav
 from eav.exceptions import IllegalAssignmentException
-from eav.models import Attribute, Value
+from eav.models import Attribute, EnumGroup, EnumValue, Value
 from eav.registry import EavConfig
 from test_project.models import Doctor, Encounter, Patient, RegisterTestModel
 
@@ -126,6 +128,132 @@ class Attributes(TestCase):
 
         assert patient.eav.age == big_num
 
+    def test_save_validates_changed_fields_only(self):
+        """Ensure unchanged attributes are saved without re-validation."""
+        age = Attribute.objects.get(slug='age')
+
+        # update only
+        with self.assertNumQueries(1):
+            age.save()
+
+        age.display_order = 2
+        with self.assertNumQueries(1):
+            age.save()
+
+        age.slug = 'height'
+        with self.assertRaises(ValidationError):
+            age.save()
+
+    def test_save_copy_validates_all_fields(self):
+        """Ensure an attribute copied by clearing its pk is fully validated."""
+        age = Attribute.objects.get(slug='age')
+        age.pk = None
+        age.name = 'years'
+
+        with self.assertRaises(ValidationError):
+            age.save()
+
+    def test_save_value(self):
+        """Tests saving, updating and deleting a single value directly."""
+        patient = Patient.objects.create(name='Jon')
+        age = Attribute.objects.get(slug='age')
+
+        # existing value, savepoint, insert, release
+        with self.assertNumQueries(4):
+            age.save_value(patient, 3)
+        assert Patient.objects.get(pk=patient.pk).eav.age == 3
+
+        # existing value, savepoint, update, release
+        with self.assertNumQueries(4):
+            age.save_value(patient, 4)
+        assert Patient.objects.get(pk=patient.pk).eav.age == 4
+        assert Value.objects.filter(
+            value_int=4,
+            value_float__isnull=True,
+            value_text__isnull=True,
+        ).exists()
+
+        with self.assertNumQueries(1):
+            age.save_value(patient, None)
+        assert Value.objects.count() == 0
+
+    def test_bulk_save_values_query_count(self):
+        """Ensure saving an entity doesn't issue queries per attribute."""
+        patient = Patient.objects.create(name='Jon')
+        patient.eav.age = 3
+        patient.eav.height = 2.3
+        patient.eav.weight = 80.0
+        patient.eav.color = 'red'
+
+        # attributes, existing values, savepoint, insert, release
+        with self.assertNumQueries(5):
+            patient.eav.save()
+
+        patient.eav.age = 4
+        patient.eav.height = 2.5
+        patient.eav.weight = None
+
+        # attributes, existing values, savepoint, delete, update, release
+        with self.assertNumQueries(6):
+            patient.eav.save()
+
+        # attributes, existing values; nothing changed, so no writes
+        with self.assertNumQueries(2):
+            patient.eav.save()
+
+        Value.objects.filter(attribute__slug='age').delete()
+
+        # attributes, existing values, savepoint, insert of the deleted
+        # value, release
+        with self.assertNumQueries(5):
+            patient.eav.save()
+
+        patient = Patient.objects.get(pk=patient.pk)
+        assert patient.eav.age == 4
+        assert patient.eav.height == 2.5
+        assert patient.eav.weight is None
+        assert patient.eav.color == 'red'
+        assert Value.objects.count() == 3
+
+    def test_bulk_save_values_query_count_related(self):
+        """Ensure enum and object values don't fetch their related rows."""
+        yes = EnumValue.objects.create(value='yes')
+        no = EnumValue.objects.create(value='no')
+        ynu = EnumGroup.objects.create(name='Yes / No')
+        ynu.values.add(yes, no)
+        for name in ('fever', 'cough', 'rash'):
+            Attribute.objects.create(
+                name=name, datatype=Attribute.TYPE_ENUM, enum_group=ynu
+            )
+        Attribute.objects.create(name='doctor', datatype=Attribute.TYPE_OBJECT)
+        joe = User.objects.create(username='joe')
+        ann = User.objects.create(username='ann')
+        ContentType.objects.get_for_model(User)
+
+        patient = Patient.objects.create(name='Jon')
+        patient.eav.fever = yes
+        patient.eav.cough = yes
+        patient.eav.rash = no
+        patient.eav.doctor = joe
+
+        # attributes, existing values, savepoint, insert, release
+        with self.assertNumQueries(5):
+            patient.eav.save()
+
+        patient.eav.fever = no
+        patient.eav.cough = no
+        patient.eav.doctor = ann
+
+        # attributes, existing values, savepoint, update, release
+        with self.assertNumQueries(5):
+            patient.eav.save()
+
+        patient = Patient.objects.get(pk=patient.pk)
+        assert patient.eav.fever == no
+        assert patient.eav.cough == no
+        assert patient.eav.rash == no
+        assert patient.eav.doctor == ann
+
 
 class TestAttributeModel(django.TestCase):
     """This is a property-based test that ensures model correctness."""
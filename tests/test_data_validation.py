@@ -159,6 +159,52 @@ class DataValidation(TestCase):
         p.save()
         self.assertEqual(Patient.objects.get(pk=p.pk).eav.fever, no)
 
+    def test_enum_validation_queries_choices_once(self):
+        yes = EnumValue.objects.create(value='yes')
+        no = EnumValue.objects.create(value='no')
+        ynu = EnumGroup.objects.create(name='Yes / No')
+        ynu.values.add(yes, no)
+        a = Attribute.objects.create(
+            name='Fever?', datatype=Attribute.TYPE_ENUM, enum_group=ynu
+        )
+
+        # enum values, not prefetched
+        with self.assertNumQueries(1):
+            a.validate_value(yes)
+            self.assertRaises(ValidationError, a.validate_value, 'maybe')
+
+        unsure = EnumValue.objects.create(value='unsure')
+        ynu.values.add(unsure)
+        a.refresh_from_db()
+        a.validate_value(unsure)
+
+        colors = EnumGroup.objects.create(name='Colors')
+        red = EnumValue.objects.create(value='red')
+        colors.values.add(red)
+        a.enum_group = colors
+        a.validate_value(red)
+        self.assertRaises(ValidationError, a.validate_value, yes)
+
+        # attribute with its enum group, enum values
+        with self.assertNumQueries(2):
+            a = Attribute.objects.with_choices().get(pk=a.pk)
+            a.validate_value(yes)
+            a.validate_value('no')
+            self.assertRaises(ValidationError, a.validate_value, 'maybe')
+
+    def test_changing_datatype_in_use(self):
+        p = Patient.objects.create(name='Joe', eav__age=5)
+        age = Attribute.objects.get(slug='age')
+        age.datatype = Attribute.TYPE_TEXT
+        self.assertRaises(ValidationError, age.save)
+
+        p.eav.age = None
+        p.save()
+        age.save()
+        self.assertEqual(
+            Attribute.objects.get(slug='age').datatype, Attribute.TYPE_TEXT
+        )
+
     def test_enum_datatype_without_enum_group(self):
         a = Attribute(name='Age Bracket', datatype=Attribute.TYPE_ENUM)
         self.assertRaises(ValidationError, a.save)
@@ -183,6 +229,10 @@ class DataValidation(TestCase):
         a = Attribute(name='color', datatype=Attribute.TYPE_TEXT, enum_group=ynu)
         self.assertRaises(ValidationError, a.save)
 
+        a = Attribute(name='color', datatype=Attribute.TYPE_TEXT, enum_group_id=ynu.pk)
+        with self.assertNumQueries(0):
+            self.assertRaises(ValidationError, a.clean)
+
     def test_json_validation(self):
         p = Patient.objects.create(name='Joe')
         p.eav.extra = 5
@@ -1,7 +1,8 @@
+from django.utils.text import slugify
 from hypothesis import given
 from hypothesis import strategies as st
 
-from eav.logic.slug import SLUGFIELD_MAX_LENGTH, generate_slug
+from eav.logic.slug import SLUGFIELD_MAX_LENGTH, _slugify_ascii, generate_slug
 
 
 @given(st.text())
@@ -18,3 +19,9 @@ def test_generate_long_slug_text(name: str) -> None:
     slug = generate_slug(name)
 
     assert len(slug) <= SLUGFIELD_MAX_LENGTH
+
+
+@given(st.text(alphabet=st.characters(max_codepoint=127)))
+def test_slugify_ascii_matches_slugify(name: str) -> None:
+    """Ensures the ASCII fast path generates the same slugs as Django."""
+    assert _slugify_ascii(name) == slugify(name)
@@ -1,5 +1,7 @@
 import pytest
+from django.core import serializers
 from django.test import TestCase
+from django.utils import translation
 
 import eav
 from eav.models import Attribute, EnumGroup, EnumValue, Value
@@ -40,6 +42,73 @@ class MiscModels(TestCase):
         )
         self.assertEqual(a.help_text, desc)
 
+    def test_attribute_display_follows_changes(self):
+        a = Attribute.objects.create(name='age', datatype=Attribute.TYPE_INT)
+        self.assertEqual(str(a), 'age (Integer)')
+        self.assertEqual(a.natural_key(), ('age', 'age'))
+
+        a.name = 'years'
+        a.datatype = Attribute.TYPE_FLOAT
+        self.assertEqual(str(a), 'years (Float)')
+        self.assertEqual(a.natural_key(), ('years', 'age'))
+
+        with translation.override('ru'):
+            self.assertEqual(str(a), 'years (Число с плавающей запятой)')
+
+    def test_attribute_choices_are_prefetched(self):
+        yes = EnumValue.objects.create(value='yes')
+        no = EnumValue.objects.create(value='no')
+        ynu = EnumGroup.objects.create(name='Yes / No')
+        ynu.values.add(yes, no)
+        Attribute.objects.create(
+            name='is_patient', datatype=Attribute.TYPE_ENUM, enum_group=ynu
+        )
+        Attribute.objects.create(name='age', datatype=Attribute.TYPE_INT)
+
+        with self.assertNumQueries(2):
+            attributes = list(Attribute.objects.with_choices())
+
+        with self.assertNumQueries(0):
+            age_choices = attributes[0].get_choices()
+            enum_choices = list(attributes[1].get_choices())
+        self.assertIsNone(age_choices)
+        self.assertCountEqual(enum_choices, [yes, no])
+
+    def test_attribute_lean_queryset(self):
+        Attribute.objects.create(
+            name='age', description='Patient age', datatype=Attribute.TYPE_INT
+        )
+        a = Attribute.objects.lean().get(slug='age')
+
+        deferred = {'name', 'description', 'display_order', 'modified', 'created'}
+        self.assertEqual(a.get_deferred_fields(), deferred)
+        with self.assertNumQueries(0):
+            a.validate_value(5)
+
+        ynu = EnumGroup.objects.create(name='Yes / No')
+        ynu.values.add(EnumValue.objects.create(value='yes'))
+        Attribute.objects.create(
+            name='is_patient', datatype=Attribute.TYPE_ENUM, enum_group=ynu
+        )
+        with self.assertNumQueries(1):
+            a = Attribute.objects.lean().get(slug='is_patient')
+        self.assertEqual(a.datatype, Attribute.TYPE_ENUM)
+
+        chained = Attribute.objects.filter(slug='age').lean().with_choices()
+        self.assertEqual(chained.get().get_deferred_fields(), deferred)
+
+    def test_attribute_queries_are_plain_by_default(self):
+        ynu = EnumGroup.objects.create(name='Yes / No')
+        ynu.values.add(EnumValue.objects.create(value='yes'))
+        Attribute.objects.create(
+            name='is_patient', datatype=Attribute.TYPE_ENUM, enum_group=ynu
+        )
+
+        with self.assertNumQueries(1):
+            Attribute.objects.get(slug='is_patient')
+        with self.assertNumQueries(1):
+            self.assertEqual(len(list(Attribute.objects.iterator())), 1)
+
     def test_setting_to_none_deletes_value(self):
         eav.register(Patient)
         Attribute.objects.create(name='age', datatype=Attribute.TYPE_INT)
@@ -49,6 +118,18 @@ class MiscModels(TestCase):
         p.save()
         self.assertEqual(Value.objects.count(), 0)
 
+    def test_fixture_loading_skips_eav_handlers(self):
+        eav.register(Patient)
+        self.addCleanup(eav.unregister, Patient)
+        Attribute.objects.create(name='age', datatype=Attribute.TYPE_INT, required=True)
+        fixture = serializers.serialize('json', [Patient(pk=1, name='Bob')])
+
+        for deserialized in serializers.deserialize('json', fixture):
+            deserialized.save()
+
+        self.assertTrue(Patient.objects.filter(name='Bob').exists())
+        self.assertEqual(Value.objects.count(), 0)
+
     def test_string_enum_value_assignment(self):
         yes = EnumValue.objects.create(value='yes')
         no = EnumValue.objects.create(value='no')
@@ -3,7 +3,9 @@ import uuid
 import pytest
 from django.db import models
 
+from eav.logic.entity_pk import get_entity_pk_type
 from eav.logic.object_pk import get_pk_format
+from test_project.models import Doctor, Patient
 
 
 def test_get_uuid_primary_key(settings) -> None:
@@ -31,3 +33,10 @@ def test_get_default_primary_key(settings) -> None:
     assert isinstance(primary_field, models.BigAutoField)
     assert primary_field.primary_key
     assert not primary_field.editable
+
+
+def test_get_entity_pk_type() -> None:
+    assert get_entity_pk_type(Doctor) == 'entity_uuid'
+    assert get_entity_pk_type(Doctor(name='Lu')) == 'entity_uuid'
+    assert get_entity_pk_type(Patient) == 'entity_id'
+    assert get_entity_pk_type(Patient(name='Jon')) == 'entity_id'